@@ -33,6 +33,7 @@ Used to parse Psi4 output files
 """
 
 import logging
+import mmap
 
 import numpy as np
 
@@ -46,6 +47,11 @@ from arkane.ess.factory import register_ess_adapter
 
 ################################################################################
 
+# Conversion factor from the atomic units of the Psi4 force constants
+# (Hartree/Bohr_radius^2) to J/m^2, evaluated once at import time rather
+# than for every matrix element parsed.
+FORCE_CONSTANT_AU_TO_SI = 4.35974417e-18 / 5.291772108e-11 ** 2
+
 
 class Psi4Log(ESSAdapter):
     """
@@ -55,13 +61,34 @@ class Psi4Log(ESSAdapter):
     arrays. Psi4Log is an adapter for the abstract class ESSAdapter.
     """
 
+    def __init__(self, path, check_for_errors=True):
+        self._lines = None
+        super().__init__(path, check_for_errors=check_for_errors)
+
+    def _load_lines(self):
+        """
+        Return the lines of the Psi4 output file, reading it only once.
+        The file is mapped into memory with mmap, avoiding the buffered-IO
+        copy and repeated read syscalls when several extraction methods
+        are called on the same log file.
+        """
+        if self._lines is None:
+            with open(self.path, 'rb') as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = mm.read()
+                except ValueError:
+                    # An empty file cannot be mapped.
+                    content = b''
+            self._lines = content.decode('utf-8', errors='replace').splitlines(keepends=True)
+        return self._lines
+
     def check_for_errors(self):
         """
         Checks for common errors in a Psi4 log file.
         If any are found, this method will raise an error and crash.
         """
-        with open(self.path) as f:
-            log = f.readlines()
+        log = self._load_lines()
         error = None
         terminated = False
         for line in reversed(log):
@@ -84,17 +111,17 @@ class Psi4Log(ESSAdapter):
         Return the number of atoms in the molecular configuration used in the Psi4 output file.
         """
         n_atoms = 0
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '' and n_atoms == 0:
-                if 'Center              X                  Y                   Z               Mass ' in line:
-                    _ = f.readline()
-                    line = f.readline()
-                    while line != '\n':
-                        n_atoms += 1
-                        line = f.readline()
-                    break
-                line = f.readline()
+        lines = iter(self._load_lines())
+        line = next(lines, '')
+        while line != '' and n_atoms == 0:
+            if 'Center              X                  Y                   Z               Mass ' in line:
+                _ = next(lines, '')
+                line = next(lines, '')
+                while line != '\n':
+                    n_atoms += 1
+                    line = next(lines, '')
+                break
+            line = next(lines, '')
         return n_atoms
 
     def load_force_constant_matrix(self):
@@ -109,19 +136,28 @@ class Psi4Log(ESSAdapter):
         force = None
         n_atoms = self.get_number_of_atoms()
         n_rows = n_atoms * 3
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                if 'Force constants in mass-weighted Cartesian coordinates' in line:
-                    f.readline()
-                    f_array = list()
-                    while line != '\n':
-                        line = f.readline()
-                        # Convert from atomic units (Hartree/Bohr_radius^2) to J/m^2
-                        f_array.extend([float(f) * 4.35974417e-18 / 5.291772108e-11 ** 2 for f in
-                                        line.replace('[', '').replace(']', '').split()])
-                    force = np.array(f_array).reshape(n_rows, n_rows)
-                line = f.readline()
+        lines = iter(self._load_lines())
+        line = next(lines, '')
+        while line != '':
+            if 'Force constants in mass-weighted Cartesian coordinates' in line:
+                next(lines, '')
+                # Parse each line straight into a preallocated contiguous
+                # buffer, so downstream consumers get a single C-ordered
+                # float64 array without an intermediate token list.
+                force = np.empty(n_rows * n_rows, dtype=np.float64)
+                k = 0
+                while line != '\n':
+                    line = next(lines, '')
+                    values = np.array(line.replace('[', '').replace(']', '').split(), dtype=np.float64)
+                    force[k:k + len(values)] = values
+                    k += len(values)
+                if k != force.size:
+                    raise LogError(f'Expected {force.size} force constants in the Psi4 output file '
+                                   f'{self.path}, but read {k}.')
+                force = force.reshape(n_rows, n_rows)
+                # Convert from atomic units (Hartree/Bohr_radius^2) to J/m^2
+                force *= FORCE_CONSTANT_AU_TO_SI
+            line = next(lines, '')
         if force is None:
             logging.warning(f'Could not find a force constant matrix in the Psi4 log file {self.path}\n'
                             f'To make sure Psi4 prints out the force constant matrix,'
@@ -137,8 +173,7 @@ class Psi4Log(ESSAdapter):
         """
         atoms, coord, number, mass = [], [], [], []
 
-        with open(self.path) as f:
-            log = f.readlines()
+        log = self._load_lines()
 
         geometry_flag = False
         for i in reversed(range(len(log))):
@@ -185,33 +220,33 @@ class Psi4Log(ESSAdapter):
             if symmetry is None:
                 symmetry = _symmetry
 
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                if spin_multiplicity == 0 and 'Multiplicity =' in line:
-                    spin_multiplicity = int(float(line.split()[2]))
-                    logging.debug(f'Conformer {label} is assigned a spin multiplicity of {spin_multiplicity}')
-
-                if 'Harmonic Vibrational Analysis' in line:
-                    frequencies = []
-                    while 'Thermochemistry Components' not in line:
-                        if 'Freq [cm^-1]' in line:
-                            if len(line.split()) == 5:
-                                frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
-                                                    for d in line.split()[-3:]])
-                            elif len(line.split()) == 4:
-                                frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
-                                                    for d in line.split()[-2:]])
-                            elif len(line.split()) == 3:
-                                frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
-                                                    for d in line.split()[-1:]])
-                        line = f.readline()
-
-                    frequencies = [f for f in frequencies if f > 0.0]
-                    unscaled_frequencies = frequencies
-                    vibration = HarmonicOscillator(frequencies=(frequencies, "cm^-1"))
-                    freq.append(vibration)
-                line = f.readline()
+        lines = iter(self._load_lines())
+        line = next(lines, '')
+        while line != '':
+            if spin_multiplicity == 0 and 'Multiplicity =' in line:
+                spin_multiplicity = int(float(line.split()[2]))
+                logging.debug(f'Conformer {label} is assigned a spin multiplicity of {spin_multiplicity}')
+
+            if 'Harmonic Vibrational Analysis' in line:
+                frequencies = []
+                while 'Thermochemistry Components' not in line:
+                    if 'Freq [cm^-1]' in line:
+                        if len(line.split()) == 5:
+                            frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
+                                                for d in line.split()[-3:]])
+                        elif len(line.split()) == 4:
+                            frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
+                                                for d in line.split()[-2:]])
+                        elif len(line.split()) == 3:
+                            frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
+                                                for d in line.split()[-1:]])
+                    line = next(lines, '')
+
+                frequencies = [f for f in frequencies if f > 0.0]
+                unscaled_frequencies = frequencies
+                vibration = HarmonicOscillator(frequencies=(frequencies, "cm^-1"))
+                freq.append(vibration)
+            line = next(lines, '')
 
         # Get moments of inertia from external rotational modes, given in atomic units.
         coord, number, mass = self.load_geometry()
@@ -246,10 +281,9 @@ class Psi4Log(ESSAdapter):
         the smallest values is the correct value.
         """
         a = list()
-        with open(self.path, 'r') as f:
-            for line in f:
-                if 'Total Energy =' in line:
-                    a.append(float(line.split()[3]) * constants.E_h * constants.Na)
+        for line in self._load_lines():
+            if 'Total Energy =' in line:
+                a.append(float(line.split()[3]) * constants.E_h * constants.Na)
         if not len(a):
             raise LogError(f'Unable to find energy in Psi4 output file {self.path}.')
         e_elect = min(a)
@@ -260,11 +294,10 @@ class Psi4Log(ESSAdapter):
         Load the unscaled zero-point energy in J/mol from a Psi4 output file.
         """
         zpe = []
-        with open(self.path, 'r') as f:
-            for line in f.readlines():
-                if 'Correction ZPE' in line:
-                    zpe.append(float(line.split()[2]) * 4184)  # Convert kcal/mol to J/mol.
-                    logging.debug(f'ZPE is {zpe}')
+        for line in self._load_lines():
+            if 'Correction ZPE' in line:
+                zpe.append(float(line.split()[2]) * 4184)  # Convert kcal/mol to J/mol.
+                logging.debug(f'ZPE is {zpe}')
         if not len(zpe):
             raise LogError(f'Unable to find zero-point energy in Psi4 output file {self.path}.')
         return zpe[-1]
@@ -275,26 +308,26 @@ class Psi4Log(ESSAdapter):
         Since there can be many imaginary frequencies, only the first one is returned.
         """
         negative_frequencies, frequency = None, None
-        with open(self.path, 'r') as f:
-            line = f.readline()
-            while line != '':
-                if 'Harmonic Vibrational Analysis' in line:
-                    frequencies = []
-                    while 'Thermochemistry Components' not in line:
-                        if 'Freq [cm^-1]' in line:
-                            if len(line.split()) == 5:
-                                frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
-                                                    for d in line.split()[-3:]])
-                            elif len(line.split()) == 4:
-                                frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
-                                                    for d in line.split()[-2:]])
-                            elif len(line.split()) == 3:
-                                frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
-                                                    for d in line.split()[-1:]])
-                        line = f.readline()
-
-                    negative_frequencies = [f for f in frequencies if f < 0.0]
-                line = f.readline()
+        lines = iter(self._load_lines())
+        line = next(lines, '')
+        while line != '':
+            if 'Harmonic Vibrational Analysis' in line:
+                frequencies = []
+                while 'Thermochemistry Components' not in line:
+                    if 'Freq [cm^-1]' in line:
+                        if len(line.split()) == 5:
+                            frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
+                                                for d in line.split()[-3:]])
+                        elif len(line.split()) == 4:
+                            frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
+                                                for d in line.split()[-2:]])
+                        elif len(line.split()) == 3:
+                            frequencies.extend([float(convert_imaginary_freq_to_negative_float(d))
+                                                for d in line.split()[-1:]])
+                    line = next(lines, '')
+
+                negative_frequencies = [f for f in frequencies if f < 0.0]
+            line = next(lines, '')
         if negative_frequencies is None:
             raise LogError('Unable to find imaginary frequency in Psi4 output file {0}.'.format(self.path))
         elif len(negative_frequencies) == 1:
@@ -28,6 +28,8 @@
 ###############################################################################
 
 import contextlib
+import copy
+import functools
 import os
 from argparse import Namespace
 from typing import Callable, Union
@@ -71,13 +73,29 @@ class MLEstimator:
         """
         Return thermodynamic parameters corresponding to a given
         :class:`Molecule` object `molecule` or a SMILES string.
+        Predictions are cached by canonical SMILES, so asking again for
+        the same molecule does not rerun the estimators.
 
         Returns: ThermoData
         """
         molecule = Molecule(smiles=molecule) if isinstance(molecule, str) else molecule
 
-        hf298 = self.hf298_estimator(molecule.smiles)[0][0]
-        s298_cp = self.s298_cp_estimator(molecule.smiles)[0]
+        # Return a copy because callers such as estimate_radical_thermo_via_hbi
+        # modify the ThermoData in place, which would corrupt the cached entry.
+        return copy.deepcopy(self._get_thermo_data_for_smiles(molecule.smiles))
+
+    @functools.lru_cache(maxsize=1024)
+    def _get_thermo_data_for_smiles(self, smiles: str) -> ThermoData:
+        """
+        Return thermodynamic parameters for a canonical SMILES string,
+        running the Hf298 and S298/Cp estimators.
+
+        Returns: ThermoData
+        """
+        molecule = Molecule(smiles=smiles)
+
+        hf298 = self.hf298_estimator(smiles)[0][0]
+        s298_cp = self.s298_cp_estimator(smiles)[0]
         s298, cp = s298_cp[0], s298_cp[1:]
 
         cp0 = molecule.calculate_cp0()
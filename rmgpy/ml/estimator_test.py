@@ -31,7 +31,6 @@ import os
 import unittest
 
 from rmgpy import settings
-from rmgpy.ml.estimator import MLEstimator
 
 
 class TestMLEstimator(unittest.TestCase):
@@ -39,15 +38,20 @@ class TestMLEstimator(unittest.TestCase):
     Contains unit tests for rmgpy.ml.estimator
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         Set up the MLEstimator class. This method is run once before all
-        other unit tests.
+        other unit tests, so the model weights are only loaded once.
         """
+        # Imported here so that test collection does not pay for loading
+        # chemprop and its torch dependencies.
+        from rmgpy.ml.estimator import MLEstimator
+
         models_path = os.path.join(settings['database.directory'], 'thermo', 'ml', 'main')
         hf298_path = os.path.join(models_path, 'hf298')
         s298_cp_path = os.path.join(models_path, 's298_cp')
-        self.ml_estimator = MLEstimator(hf298_path, s298_cp_path)
+        cls.ml_estimator = MLEstimator(hf298_path, s298_cp_path)
 
     def test_get_thermo_data(self):
         """